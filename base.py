@@ -109,6 +109,49 @@ class PredicateType(str, Enum):
     SUPPORTS = "supports"
 
 
+# Stable small-integer codes for compact storage and columnar batches.
+# Append new predicates with the next free code; never renumber existing ones.
+PREDICATE_CODES: dict[PredicateType, int] = {
+    PredicateType.AUTHORED_BY: 1,
+    PredicateType.CITES: 2,
+    PredicateType.CITED_BY: 3,
+    PredicateType.CONTRADICTS: 4,
+    PredicateType.REFUTES: 5,
+    PredicateType.STUDIED_IN: 6,
+    PredicateType.PREDICTS: 7,
+    PredicateType.TESTED_BY: 8,
+    PredicateType.PART_OF: 9,
+    PredicateType.GENERATES: 10,
+    PredicateType.CAUSES: 11,
+    PredicateType.PREVENTS: 12,
+    PredicateType.INCREASES_RISK: 13,
+    PredicateType.DECREASES_RISK: 14,
+    PredicateType.TREATS: 15,
+    PredicateType.MANAGES: 16,
+    PredicateType.CONTRAINDICATED_FOR: 17,
+    PredicateType.SIDE_EFFECT: 18,
+    PredicateType.BINDS_TO: 19,
+    PredicateType.INHIBITS: 20,
+    PredicateType.ACTIVATES: 21,
+    PredicateType.UPREGULATES: 22,
+    PredicateType.DOWNREGULATES: 23,
+    PredicateType.ENCODES: 24,
+    PredicateType.METABOLIZES: 25,
+    PredicateType.PARTICIPATES_IN: 26,
+    PredicateType.DIAGNOSES: 27,
+    PredicateType.DIAGNOSED_BY: 28,
+    PredicateType.INDICATES: 29,
+    PredicateType.PRECEDES: 30,
+    PredicateType.CO_OCCURS_WITH: 31,
+    PredicateType.ASSOCIATED_WITH: 32,
+    PredicateType.INTERACTS_WITH: 33,
+    PredicateType.LOCATED_IN: 34,
+    PredicateType.AFFECTS: 35,
+    PredicateType.SUPPORTS: 36,
+}
+PREDICATES_BY_CODE: dict[int, PredicateType] = {code: predicate for predicate, code in PREDICATE_CODES.items()}
+
+
 class ClaimPredicate(BaseModel):
     """
     Describes the nature of a claim made in a paper.
@@ -33,6 +33,7 @@ All medical entities (Disease, Gene, Drug, Protein, etc.) share these base prope
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
+from itertools import chain, islice
 from typing import Any, Dict, List, Literal, Optional, cast
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -1532,7 +1533,6 @@ class InMemoryEntityCollection(EntityCollectionInterface, BaseModel):
 
     def list_entities(self, limit: Optional[int] = None, offset: int = 0) -> list["BaseMedicalEntity"]:
         """List entities, optionally with pagination."""
-        all_entities = []
         collections_to_search: list[dict[str, BaseMedicalEntity]] = [
             cast(dict[str, BaseMedicalEntity], self.diseases),
             cast(dict[str, BaseMedicalEntity], self.genes),
@@ -1547,15 +1547,10 @@ class InMemoryEntityCollection(EntityCollectionInterface, BaseModel):
             cast(dict[str, BaseMedicalEntity], self.statistical_methods),
             cast(dict[str, BaseMedicalEntity], self.evidence_lines),
         ]
-        for collection in collections_to_search:
-            all_entities.extend(collection.values())
-
-        # Apply pagination
-        paginated_entities = all_entities[offset:]
-        if limit is not None:
-            paginated_entities = paginated_entities[:limit]
-
-        return paginated_entities
+        # Walk the collections lazily so a page costs O(offset + limit), not a copy of every entity
+        all_entities = chain.from_iterable(collection.values() for collection in collections_to_search)
+        stop = None if limit is None else offset + limit
+        return list(islice(all_entities, offset, stop))
 
     def save(self, path: str):
         """Save to JSONL with type information"""
@@ -1583,10 +1578,19 @@ class InMemoryEntityCollection(EntityCollectionInterface, BaseModel):
                     f.write(json.dumps(record) + "\n")
 
     @classmethod
-    def load(cls, path: str) -> "InMemoryEntityCollection":
-        """Load from JSONL with type information"""
+    def load(cls, path: str, trusted: bool = False) -> "InMemoryEntityCollection":
+        """Load from JSONL with type information
+
+        Pass `trusted=True` for files written by `save()`: rows are rebuilt with
+        `model_construct` instead of being re-validated field by field.
+        """
         collection = cls()
 
+        def rehydrate(model_cls, data):
+            if trusted:
+                return _construct_trusted(model_cls, data)
+            return model_cls.model_validate(data)
+
         with open(path) as f:
             for line in f:
                 record = json.loads(line)
@@ -1595,40 +1599,40 @@ class InMemoryEntityCollection(EntityCollectionInterface, BaseModel):
                 entity: BaseMedicalEntity | None = None
 
                 if entity_type == "disease":
-                    entity = Disease.model_validate(data)
+                    entity = rehydrate(Disease, data)
                     collection.diseases[entity.entity_id] = entity
                 elif entity_type == "gene":
-                    entity = Gene.model_validate(data)
+                    entity = rehydrate(Gene, data)
                     collection.genes[entity.entity_id] = entity
                 elif entity_type == "drug":
-                    entity = Drug.model_validate(data)
+                    entity = rehydrate(Drug, data)
                     collection.drugs[entity.entity_id] = entity
                 elif entity_type == "protein":
-                    entity = Protein.model_validate(data)
+                    entity = rehydrate(Protein, data)
                     collection.proteins[entity.entity_id] = entity
                 elif entity_type == "symptom":
-                    entity = Symptom.model_validate(data)
+                    entity = rehydrate(Symptom, data)
                     collection.symptoms[entity.entity_id] = entity
                 elif entity_type == "procedure":
-                    entity = Procedure.model_validate(data)
+                    entity = rehydrate(Procedure, data)
                     collection.procedures[entity.entity_id] = entity
                 elif entity_type == "biomarker":
-                    entity = Biomarker.model_validate(data)
+                    entity = rehydrate(Biomarker, data)
                     collection.biomarkers[entity.entity_id] = entity
                 elif entity_type == "pathway":
-                    entity = Pathway.model_validate(data)
+                    entity = rehydrate(Pathway, data)
                     collection.pathways[entity.entity_id] = entity
                 elif entity_type == "hypothesis":
-                    entity = Hypothesis.model_validate(data)
+                    entity = rehydrate(Hypothesis, data)
                     collection.hypotheses[entity.entity_id] = entity
                 elif entity_type == "study_design":
-                    entity = StudyDesign.model_validate(data)
+                    entity = rehydrate(StudyDesign, data)
                     collection.study_designs[entity.entity_id] = entity
                 elif entity_type == "statistical_method":
-                    entity = StatisticalMethod.model_validate(data)
+                    entity = rehydrate(StatisticalMethod, data)
                     collection.statistical_methods[entity.entity_id] = entity
                 elif entity_type == "evidence_line":
-                    entity = EvidenceLine.model_validate(data)
+                    entity = rehydrate(EvidenceLine, data)
                     collection.evidence_lines[entity.entity_id] = entity
 
         return collection
@@ -1638,10 +1642,7 @@ class InMemoryEntityCollection(EntityCollectionInterface, BaseModel):
         Find entities similar to query embedding.
         Returns list of (entity, similarity_score) tuples.
         """
-        from numpy import dot
-        from numpy.linalg import norm
-
-        results = []
+        import numpy as np
 
         collections_to_search: list[dict[str, BaseMedicalEntity]] = [
             cast(dict[str, BaseMedicalEntity], self.diseases),
@@ -1649,20 +1650,27 @@ class InMemoryEntityCollection(EntityCollectionInterface, BaseModel):
             cast(dict[str, BaseMedicalEntity], self.drugs),
             cast(dict[str, BaseMedicalEntity], self.proteins),
         ]
-        for collection_dict in collections_to_search:
-            for entity in collection_dict.values():
-                if entity.embedding is None:
-                    continue
-
-                # Cosine similarity
-                similarity = dot(query_embedding, entity.embedding) / (norm(query_embedding) * norm(entity.embedding))
-
-                if similarity >= threshold:
-                    results.append((entity, similarity))
-
-        # Sort by similarity
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        candidates = [entity for collection_dict in collections_to_search for entity in collection_dict.values() if entity.embedding is not None]
+        if not candidates:
+            return []
+
+        # Cosine similarity for every candidate in one matrix-vector product
+        matrix = np.asarray([entity.embedding for entity in candidates], dtype=np.float64)
+        query = np.asarray(query_embedding, dtype=np.float64)
+        similarities = (matrix @ query) / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query))
+
+        # Sort by similarity (stable, so ties keep collection order)
+        matches = np.flatnonzero(similarities >= threshold)
+        matches = matches[np.argsort(-similarities[matches], kind="stable")][:top_k]
+        return [(candidates[i], float(similarities[i])) for i in matches]
+
+
+def _construct_trusted(model_cls, data: dict):
+    """Build an entity from a row this package wrote itself, skipping validation."""
+    created_at = data.get("created_at")
+    if isinstance(created_at, str):
+        data = {**data, "created_at": datetime.fromisoformat(created_at)}
+    return model_cls.model_construct(**data)
 
 
 # Backward compatibility alias - existing code continues to work
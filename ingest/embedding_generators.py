@@ -4,8 +4,11 @@ Embedding generator implementations.
 Provides concrete implementations of EmbeddingGeneratorInterface.
 """
 
+import threading
+from collections import OrderedDict
 from typing import Optional
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from .embedding_interfaces import EmbeddingGeneratorInterface
@@ -14,23 +17,44 @@ from .embedding_interfaces import EmbeddingGeneratorInterface
 class SentenceTransformerEmbeddingGenerator(EmbeddingGeneratorInterface):
     """SentenceTransformer-based embedding generator."""
 
-    def __init__(self, model_name: str = "sentence-transformers/all-mpnet-base-v2", device: Optional[str] = None):
+    def __init__(self, model_name: str = "sentence-transformers/all-mpnet-base-v2", device: Optional[str] = None, cache_size: int = 0):
         """
         Initialize the embedding generator.
 
         Args:
             model_name: Name of the sentence-transformers model
             device: Device to run on ('cpu', 'cuda', etc.). If None, auto-detects.
+            cache_size: Number of single-text embeddings to memoize (default 0, disabled)
         """
         self._model_name = model_name
         self._model = SentenceTransformer(model_name, device=device)
         # Get embedding dimension by encoding a dummy string
         dummy_embedding = self._model.encode(["dummy"], convert_to_numpy=True)
         self._embedding_dim = len(dummy_embedding[0])
+        # LRU of read-only float32 vectors, so repeated query strings skip the transformer forward pass
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        # Guards the lookup/insert/evict sequence; the model call itself runs outside the lock
+        self._cache_lock = threading.Lock()
 
     def generate_embedding(self, text: str) -> list[float]:
         """Generate a single embedding for text."""
-        embedding = self._model.encode([text], convert_to_numpy=True)[0]
+        if self._cache_size <= 0:
+            return self._model.encode([text], convert_to_numpy=True)[0].tolist()
+
+        with self._cache_lock:
+            embedding = self._cache.get(text)
+            if embedding is not None:
+                self._cache.move_to_end(text)
+                return embedding.tolist()
+
+        embedding = np.asarray(self._model.encode([text], convert_to_numpy=True)[0], dtype=np.float32)
+        embedding.setflags(write=False)
+        with self._cache_lock:
+            self._cache[text] = embedding
+            self._cache.move_to_end(text)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
         return embedding.tolist()
 
     def generate_embeddings_batch(self, texts: list[str], batch_size: Optional[int] = None) -> list[list[float]]:
@@ -24,7 +24,7 @@ import argparse
 import sqlite3
 from pathlib import Path
 import numpy as np
-from typing import Optional
+from typing import Iterable, Optional
 from lxml import etree
 
 from pydantic import BaseModel, Field
@@ -81,6 +81,24 @@ class ParagraphEmbedding(BaseModel):
 # ============================================================================
 
 
+def tune_sqlite_connection(conn: sqlite3.Connection) -> None:
+    """
+    Apply write-friendly, per-connection PRAGMAs to a SQLite connection this module opens for writing.
+
+    synchronous=NORMAL skips some fsyncs per commit and the larger page cache and mmap keep
+    embedding scans out of the read() path. None of these settings are stored in the
+    database file; journal_mode is deliberately left alone because WAL would be.
+
+    Args:
+        conn: SQLite connection to tune
+    """
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=1073741824")  # 1 GiB
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    conn.execute("PRAGMA busy_timeout=5000")
+
+
 def create_entity_embeddings_table(conn: sqlite3.Connection) -> None:
     """
     Create entity_embeddings table in entities.db.
@@ -173,21 +191,28 @@ def insert_entity_embedding(conn: sqlite3.Connection, entity_id: int, embedding:
         embedding: Embedding vector as numpy array
         model_name: Name of the embedding model
     """
-    cursor = conn.cursor()
+    insert_entity_embeddings(conn, [(entity_id, embedding)], model_name)
 
-    # Convert numpy array to bytes for storage
-    embedding_bytes = embedding.astype(np.float32).tobytes()
 
-    cursor.execute(
-        """
-        INSERT OR REPLACE INTO entity_embeddings
-        (entity_id, embedding, model_name)
-        VALUES (?, ?, ?)
-    """,
-        (entity_id, embedding_bytes, model_name),
-    )
+def insert_entity_embeddings(conn: sqlite3.Connection, rows: Iterable[tuple[str, np.ndarray]], model_name: str) -> None:
+    """
+    Insert many entity embeddings in a single transaction.
 
-    conn.commit()
+    Args:
+        conn: SQLite connection to entities.db
+        rows: (entity_id, embedding) pairs
+        model_name: Name of the embedding model
+    """
+    # One executemany and one commit for the whole batch instead of a commit per row
+    with conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO entity_embeddings
+            (entity_id, embedding, model_name)
+            VALUES (?, ?, ?)
+        """,
+            ((entity_id, np.asarray(embedding, dtype=np.float32).tobytes(), model_name) for entity_id, embedding in rows),
+        )
 
 
 # def insert_paragraph_embedding(conn: sqlite3.Connection, paragraph_id: str, embedding: np.ndarray, model_name: str) -> None:
@@ -305,21 +330,31 @@ def extract_paragraphs_from_papers(storage: PipelineStorageInterface, xml_dir: O
 
 def insert_paragraph_embedding_sqlite(conn: sqlite3.Connection, paragraph_id: str, paper_id: str, embedding: np.ndarray, model_name: str) -> None:
     """Insert paragraph embedding into SQLite database."""
-    cursor = conn.cursor()
-    embedding_bytes = embedding.astype(np.float32).tobytes()
-    cursor.execute(
-        """
-        INSERT OR REPLACE INTO paragraph_embeddings (paragraph_id, paper_id, embedding, model_name)
-        VALUES (?, ?, ?, ?)
-    """,
-        (paragraph_id, paper_id, embedding_bytes, model_name),
-    )
-    conn.commit()
+    insert_paragraph_embeddings_sqlite(conn, [(paragraph_id, paper_id, embedding)], model_name)
+
+
+def insert_paragraph_embeddings_sqlite(conn: sqlite3.Connection, rows: Iterable[tuple[str, str, np.ndarray]], model_name: str) -> None:
+    """Insert many (paragraph_id, paper_id, embedding) rows into SQLite in a single transaction."""
+    with conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO paragraph_embeddings (paragraph_id, paper_id, embedding, model_name)
+            VALUES (?, ?, ?, ?)
+        """,
+            ((paragraph_id, paper_id, np.asarray(embedding, dtype=np.float32).tobytes(), model_name) for paragraph_id, paper_id, embedding in rows),
+        )
 
 
 def insert_paragraph_embedding_postgres(session: Session, paragraph_id: str, paper_id: str, embedding: list[float], model_name: str) -> None:
     """Insert paragraph embedding into PostgreSQL database with pgvector."""
-    embedding_str = "[" + ",".join(map(str, embedding)) + "]"
+    insert_paragraph_embeddings_postgres(session, [(paragraph_id, paper_id, embedding)], model_name)
+
+
+def insert_paragraph_embeddings_postgres(session: Session, rows: Iterable[tuple[str, str, list[float]]], model_name: str) -> None:
+    """Upsert many (paragraph_id, paper_id, embedding) rows into PostgreSQL with one executemany and one commit."""
+    params = [{"paragraph_id": paragraph_id, "paper_id": paper_id, "embedding": "[" + ",".join(map(str, embedding)) + "]", "model_name": model_name} for paragraph_id, paper_id, embedding in rows]
+    if not params:
+        return
     session.execute(
         text(
             """
@@ -329,7 +364,7 @@ def insert_paragraph_embedding_postgres(session: Session, paragraph_id: str, pap
         DO UPDATE SET embedding = :embedding::vector, model_name = :model_name, created_at = CURRENT_TIMESTAMP
     """
         ),
-        {"paragraph_id": paragraph_id, "paper_id": paper_id, "embedding": embedding_str, "model_name": model_name},
+        params,
     )
     session.commit()
 
@@ -347,6 +382,41 @@ def load_embedding(embedding_bytes: bytes) -> np.ndarray:
     return np.frombuffer(embedding_bytes, dtype=np.float32).reshape(EMBEDDING_DIM)
 
 
+def load_embeddings(embeddings_bytes: list[bytes]) -> np.ndarray:
+    """
+    Load many embeddings into a single matrix.
+
+    Args:
+        embeddings_bytes: Embeddings stored as bytes, one per row
+
+    Returns:
+        Numpy array of shape (len(embeddings_bytes), dim)
+    """
+    return np.frombuffer(b"".join(embeddings_bytes), dtype=np.float32).reshape(len(embeddings_bytes), EMBEDDING_DIM)
+
+
+def top_k_cosine(target: np.ndarray, matrix: np.ndarray, top_k: int) -> list[tuple[int, float]]:
+    """
+    Rank matrix rows by cosine similarity to target.
+
+    Args:
+        target: Query embedding of shape (dim,)
+        matrix: Candidate embeddings of shape (n, dim)
+        top_k: Number of rows to return
+
+    Returns:
+        List of (row_index, similarity_score) tuples, sorted by similarity (descending)
+    """
+    if top_k <= 0 or len(matrix) == 0:
+        return []
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(target)
+    # One matrix-vector product instead of a Python loop over rows; zero vectors score 0
+    similarities = np.divide(matrix @ target, norms, out=np.zeros(len(matrix), dtype=np.float64), where=norms > 0)
+    # Stable sort: highest score first, ties in row order, as the previous list.sort did
+    order = np.argsort(-similarities, kind="stable")[:top_k]
+    return [(int(i), float(similarities[i])) for i in order]
+
+
 # ============================================================================
 # Embedding Generation
 # ============================================================================
@@ -373,6 +443,7 @@ def generate_entity_embeddings(entities_db_path: Path, model_name: str = DEFAULT
 
     print(f"Connecting to {entities_db_path}")
     conn = sqlite3.connect(entities_db_path)
+    tune_sqlite_connection(conn)
 
     # Create embeddings table if it doesn't exist
     create_entity_embeddings_table(conn)
@@ -398,8 +469,7 @@ def generate_entity_embeddings(entities_db_path: Path, model_name: str = DEFAULT
 
     # Insert embeddings into database
     print("Storing embeddings in database...")
-    for entity_id, embedding in zip(entity_ids, embeddings):
-        insert_entity_embedding(conn, entity_id, embedding, model_name)
+    insert_entity_embeddings(conn, zip(entity_ids, embeddings), model_name)
 
     conn.close()
 
@@ -461,14 +531,12 @@ def generate_paragraph_embeddings(
 
     # Insert embeddings into database
     print("Storing embeddings in database...")
-    stored_count = 0
-    for (para_id, paper_id), embedding in zip(zip(paragraph_ids, paper_ids), embeddings_list):
-        if isinstance(storage, SQLitePipelineStorage):
-            embedding_array = np.array(embedding)
-            insert_paragraph_embedding_sqlite(storage.papers.conn, para_id, paper_id, embedding_array, model_name)
-        elif isinstance(storage, PostgresPipelineStorage):
-            insert_paragraph_embedding_postgres(storage.session, para_id, paper_id, embedding, model_name)
-        stored_count += 1
+    rows = list(zip(paragraph_ids, paper_ids, embeddings_list))
+    if isinstance(storage, SQLitePipelineStorage):
+        insert_paragraph_embeddings_sqlite(storage.papers.conn, rows, model_name)
+    elif isinstance(storage, PostgresPipelineStorage):
+        insert_paragraph_embeddings_postgres(storage.session, rows, model_name)
+    stored_count = len(rows)
 
     print(f"Created {stored_count} paragraph embeddings")
     return stored_count
@@ -515,19 +583,12 @@ def find_similar_entities(entities_db_path: Path, entity_id: int, top_k: int = 5
         (entity_id,),
     )
 
-    # Calculate cosine similarities
-    similarities = []
-    for eid, name, emb_bytes in cursor.fetchall():
-        embedding = load_embedding(emb_bytes)
-        # Cosine similarity
-        similarity = np.dot(target_embedding, embedding) / (np.linalg.norm(target_embedding) * np.linalg.norm(embedding))
-        similarities.append((eid, name, float(similarity)))
-
+    rows = cursor.fetchall()
     conn.close()
 
-    # Sort by similarity (descending) and return top_k
-    similarities.sort(key=lambda x: x[2], reverse=True)
-    return similarities[:top_k]
+    # Calculate cosine similarities and return top_k
+    matrix = load_embeddings([emb_bytes for _, _, emb_bytes in rows])
+    return [(rows[i][0], rows[i][1], similarity) for i, similarity in top_k_cosine(target_embedding, matrix, top_k)]
 
 
 def find_similar_paragraphs(provenance_db_path: Path, paragraph_id: str, top_k: int = 5) -> list[tuple[str, str, float]]:
@@ -566,21 +627,18 @@ def find_similar_paragraphs(provenance_db_path: Path, paragraph_id: str, top_k:
         (paragraph_id,),
     )
 
-    # Calculate cosine similarities
+    rows = cursor.fetchall()
+    conn.close()
+
+    # Calculate cosine similarities and return top_k
+    matrix = load_embeddings([emb_bytes for _, _, emb_bytes in rows])
     similarities = []
-    for pid, txt, emb_bytes in cursor.fetchall():
-        embedding = load_embedding(emb_bytes)
-        # Cosine similarity
-        similarity = np.dot(target_embedding, embedding) / (np.linalg.norm(target_embedding) * np.linalg.norm(embedding))
+    for i, similarity in top_k_cosine(target_embedding, matrix, top_k):
+        pid, txt, _ = rows[i]
         # Truncate text for preview
         text_preview = txt[:100] + "..." if len(txt) > 100 else txt
-        similarities.append((pid, text_preview, float(similarity)))
-
-    conn.close()
-
-    # Sort by similarity (descending) and return top_k
-    similarities.sort(key=lambda x: x[2], reverse=True)
-    return similarities[:top_k]
+        similarities.append((pid, text_preview, similarity))
+    return similarities
 
 
 # ============================================================================
@@ -134,15 +134,17 @@ def create_graph_indexes(session: Session, storage_type: str) -> None:
     if storage_type == "postgres":
         # PostgreSQL-specific indexes
         try:
-            # Index for relationship traversal (subject -> object)
+            # Index for relationship traversal (subject -> object); matches setup_database, whose
+            # (subject, predicate, object) index also covers subject-only lookups
             session.execute(
                 text(
                     """
-                CREATE INDEX IF NOT EXISTS idx_relationships_subject
-                ON relationships(subject_id)
+                CREATE INDEX IF NOT EXISTS idx_relationships_spo
+                ON relationships(subject_id, predicate, object_id)
             """
                 )
             )
+            session.execute(text("DROP INDEX IF EXISTS idx_relationships_subject"))
 
             # Index for relationship traversal (object -> subject)
             session.execute(
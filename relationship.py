@@ -1,10 +1,14 @@
-from typing import Literal
+import sys
+from typing import Annotated, Iterable, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from .base import PredicateType
+from .base import PREDICATE_CODES, PREDICATES_BY_CODE, PredicateType
 from .entity import EvidenceItem, Measurement
 
+# Shared constrained type so every probability-valued field reuses one schema
+Probability = Annotated[float, Field(ge=0.0, le=1.0)]
+
 # ============================================================================
 # Base Relationship Classes
 # ============================================================================
@@ -22,7 +26,7 @@ class BaseRelationship(BaseModel):
         directed: Whether this relationship is directional
     """
 
-    model_config = ConfigDict(use_enum_values=False, table_name="relationships")
+    model_config = ConfigDict(use_enum_values=False, frozen=True, extra="forbid", defer_build=True, table_name="relationships")
 
     subject_id: str
     predicate: PredicateType
@@ -31,6 +35,12 @@ class BaseRelationship(BaseModel):
     # Direction
     directed: bool = True
 
+    @field_validator("subject_id", "object_id")
+    @classmethod
+    def intern_entity_ids(cls, v: str) -> str:
+        """Intern entity IDs, which repeat across many relationships in a graph."""
+        return sys.intern(v)
+
 
 class BaseMedicalRelationship(BaseRelationship):
     """
@@ -82,7 +92,7 @@ class BaseMedicalRelationship(BaseRelationship):
     """
 
     # Core provenance (always present)
-    confidence: float = Field(ge=0.0, le=1.0, default=0.5)
+    confidence: Probability = 0.5
 
     # Lightweight tracking
     source_papers: list[str] = Field(default_factory=list)  # PMC IDs supporting this relationship
@@ -100,6 +110,12 @@ class BaseMedicalRelationship(BaseRelationship):
     # Relationship-specific properties (flexible)
     properties: dict = Field(default_factory=dict)
 
+    @field_validator("source_papers", "contradicted_by")
+    @classmethod
+    def intern_paper_ids(cls, v: list[str]) -> list[str]:
+        """Intern PMC IDs so papers cited by many relationships share one string."""
+        return [sys.intern(paper_id) for paper_id in v]
+
 
 class Causes(BaseMedicalRelationship):
     """
@@ -161,7 +177,7 @@ class Treats(BaseMedicalRelationship):
 
     predicate: Literal[PredicateType.TREATS] = PredicateType.TREATS
     efficacy: str | None = None  # Effectiveness measure
-    response_rate: float | None = Field(None, ge=0.0, le=1.0)  # Percentage of patients responding
+    response_rate: Probability | None = None  # Percentage of patients responding
     line_of_therapy: Literal["first-line", "second-line", "third-line", "maintenance", "salvage"] | None = None
     indication: str | None = None  # Specific approved use
 
@@ -195,7 +211,7 @@ class IncreasesRisk(BaseMedicalRelationship):
 
     predicate: Literal[PredicateType.INCREASES_RISK] = PredicateType.INCREASES_RISK
     risk_ratio: float | None = Field(None, gt=0.0)  # Numeric risk increase (e.g., 2.5x)
-    penetrance: float | None = Field(None, ge=0.0, le=1.0)  # Percentage who develop condition
+    penetrance: Probability | None = None  # Percentage who develop condition
     age_of_onset: str | None = None  # Typical age
     population: str | None = None  # Studied population
 
@@ -235,7 +251,7 @@ class AssociatedWith(BaseMedicalRelationship):
     predicate: Literal[PredicateType.ASSOCIATED_WITH] = PredicateType.ASSOCIATED_WITH
     association_type: Literal["positive", "negative", "neutral"] | None = None
     strength: Literal["strong", "moderate", "weak"] | None = None
-    statistical_significance: float | None = Field(None, ge=0.0, le=1.0)  # p-value
+    statistical_significance: Probability | None = None  # p-value
 
 
 class InteractsWith(BaseMedicalRelationship):
@@ -329,8 +345,8 @@ class DiagnosedBy(BaseMedicalRelationship):
     """
 
     predicate: Literal[PredicateType.DIAGNOSED_BY] = PredicateType.DIAGNOSED_BY
-    sensitivity: float | None = Field(None, ge=0.0, le=1.0)  # True positive rate
-    specificity: float | None = Field(None, ge=0.0, le=1.0)  # True negative rate
+    sensitivity: Probability | None = None  # True positive rate
+    specificity: Probability | None = None  # True negative rate
     standard_of_care: bool = False  # Whether this is standard practice
 
 
@@ -580,13 +596,35 @@ class Generates(BaseMedicalRelationship):
     predicate: Literal[PredicateType.GENERATES] = PredicateType.GENERATES
     evidence_type: str | None = None
     eco_type: str | None = None  # ECO evidence type ID
-    quality_score: float | None = Field(None, ge=0.0, le=1.0)
+    quality_score: Probability | None = None
 
 
 # ============================================================================
 # Convenience Factory Function
 # ============================================================================
 
+# Built once at import so create_relationship() is a single dict lookup per call
+_RELATIONSHIP_CLASSES: dict[PredicateType, type[BaseRelationship]] = {
+    PredicateType.CAUSES: Causes,
+    PredicateType.TREATS: Treats,
+    PredicateType.INCREASES_RISK: IncreasesRisk,
+    PredicateType.ASSOCIATED_WITH: AssociatedWith,
+    PredicateType.INTERACTS_WITH: InteractsWith,
+    PredicateType.DIAGNOSED_BY: DiagnosedBy,
+    PredicateType.SIDE_EFFECT: SideEffect,
+    PredicateType.ENCODES: Encodes,
+    PredicateType.PARTICIPATES_IN: ParticipatesIn,
+    PredicateType.CONTRAINDICATED_FOR: ContraindicatedFor,
+    PredicateType.CITES: Cites,
+    PredicateType.STUDIED_IN: StudiedIn,
+    PredicateType.AUTHORED_BY: AuthoredBy,
+    PredicateType.PART_OF: PartOf,
+    PredicateType.PREDICTS: Predicts,
+    PredicateType.REFUTES: Refutes,
+    PredicateType.TESTED_BY: TestedBy,
+    PredicateType.GENERATES: Generates,
+}
+
 
 def create_relationship(predicate: PredicateType, subject_id: str, object_id: str, **kwargs) -> BaseMedicalRelationship | ResearchRelationship:
     """
@@ -614,26 +652,143 @@ def create_relationship(predicate: PredicateType, subject_id: str, object_id: st
         ...     source_papers=["PMC999"]
         ... )
     """
-    relationship_classes = {
-        PredicateType.CAUSES: Causes,
-        PredicateType.TREATS: Treats,
-        PredicateType.INCREASES_RISK: IncreasesRisk,
-        PredicateType.ASSOCIATED_WITH: AssociatedWith,
-        PredicateType.INTERACTS_WITH: InteractsWith,
-        PredicateType.DIAGNOSED_BY: DiagnosedBy,
-        PredicateType.SIDE_EFFECT: SideEffect,
-        PredicateType.ENCODES: Encodes,
-        PredicateType.PARTICIPATES_IN: ParticipatesIn,
-        PredicateType.CONTRAINDICATED_FOR: ContraindicatedFor,
-        PredicateType.CITES: Cites,
-        PredicateType.STUDIED_IN: StudiedIn,
-        PredicateType.AUTHORED_BY: AuthoredBy,
-        PredicateType.PART_OF: PartOf,
-        PredicateType.PREDICTS: Predicts,
-        PredicateType.REFUTES: Refutes,
-        PredicateType.TESTED_BY: TestedBy,
-        PredicateType.GENERATES: Generates,
-    }
-
-    cls = relationship_classes.get(predicate, BaseMedicalRelationship)
+    cls = _RELATIONSHIP_CLASSES.get(predicate, BaseMedicalRelationship)
     return cls(subject_id=subject_id, object_id=object_id, predicate=predicate, **kwargs)
+
+
+def create_relationship_trusted(predicate: PredicateType, subject_id: str, object_id: str, **kwargs) -> BaseMedicalRelationship | ResearchRelationship:
+    """
+    Rebuild a relationship from already-validated data, skipping Pydantic validation.
+
+    Use this on load paths that read rows this package wrote itself; keep
+    `create_relationship` for anything coming from outside. Values are taken
+    as-is, so nested fields must already be model instances (e.g. `EvidenceItem`,
+    not dicts).
+
+    Args:
+
+        predicate: The type of relationship
+        subject_id: ID of the subject entity
+        object_id: ID of the object entity
+        **kwargs: Additional fields specific to the relationship type
+
+    Returns:
+
+        Appropriately typed relationship instance
+    """
+    predicate = PredicateType(predicate)
+    cls = _RELATIONSHIP_CLASSES.get(predicate, BaseMedicalRelationship)
+    return cls.model_construct(subject_id=sys.intern(subject_id), object_id=sys.intern(object_id), predicate=predicate, **kwargs)
+
+
+# ============================================================================
+# Columnar Batches
+# ============================================================================
+
+
+class RelationshipBatch:
+    """
+    Struct-of-arrays view over many relationships for vectorized graph analytics.
+
+    Each column is a NumPy array, so filters such as "all CAUSES edges above
+    0.8 confidence" are a single boolean mask instead of a Python loop over
+    model attributes. Research relationships have no confidence and are stored
+    as NaN.
+
+    Batches built with `from_relationships` keep each row's index into the
+    source list, so `to_relationships` returns the original models with all
+    their fields. `to_skeleton_relationships` rebuilds id/predicate/confidence-only
+    models from the columns alone.
+
+    Example:
+        >>> batch = RelationshipBatch.from_relationships(relationships)
+        >>> strong_causes = batch.filter(predicate=PredicateType.CAUSES, min_confidence=0.8)
+        >>> strong_causes.object_ids
+    """
+
+    def __init__(self, subject_ids, predicate_codes, object_ids, confidence, rows=None, source: list[BaseRelationship] | None = None):
+        import numpy as np
+
+        self.subject_ids = np.asarray(subject_ids, dtype=object)
+        self.predicate_codes = np.asarray(predicate_codes, dtype=np.int8)  # PREDICATE_CODES from base.py
+        self.object_ids = np.asarray(object_ids, dtype=object)
+        self.confidence = np.asarray(confidence, dtype=np.float64)
+        self.rows = np.arange(len(self.predicate_codes)) if rows is None else np.asarray(rows, dtype=np.intp)  # indices into source
+        self._source = source
+
+    @classmethod
+    def from_relationships(cls, relationships: Iterable[BaseRelationship]) -> "RelationshipBatch":
+        """Build a batch from relationship models."""
+        relationships = list(relationships)
+        nan = float("nan")
+        return cls(
+            [rel.subject_id for rel in relationships],
+            [PREDICATE_CODES[rel.predicate] for rel in relationships],
+            [rel.object_id for rel in relationships],
+            [getattr(rel, "confidence", nan) for rel in relationships],
+            source=relationships,
+        )
+
+    def to_relationships(self) -> list[BaseRelationship]:
+        """
+        Return the source relationship models for the rows in this batch.
+
+        Returns:
+
+            The original models, with every field intact
+
+        Raises:
+
+            ValueError: If the batch was built from bare columns rather than `from_relationships`
+        """
+        if self._source is None:
+            raise ValueError("RelationshipBatch has no source relationships; use to_skeleton_relationships()")
+        return [self._source[row] for row in self.rows]
+
+    def to_skeleton_relationships(self) -> list[BaseMedicalRelationship | ResearchRelationship]:
+        """
+        Build id/predicate/confidence-only models (without validation) from the batch columns.
+
+        Every other field (source_papers, evidence, properties, type-specific
+        fields) is left at its default.
+        """
+        import numpy as np
+
+        relationships = []
+        for subject_id, code, object_id, confidence in zip(self.subject_ids, self.predicate_codes, self.object_ids, self.confidence):
+            kwargs = {} if np.isnan(confidence) else {"confidence": float(confidence)}
+            relationships.append(create_relationship_trusted(PREDICATES_BY_CODE[int(code)], subject_id, object_id, **kwargs))
+        return relationships
+
+    def __len__(self) -> int:
+        return len(self.predicate_codes)
+
+    def __getitem__(self, index) -> "RelationshipBatch":
+        import numpy as np
+
+        if isinstance(index, (int, np.integer)):
+            # Keep columns 1-d so a single row is still a batch
+            index = [index]
+        return RelationshipBatch(self.subject_ids[index], self.predicate_codes[index], self.object_ids[index], self.confidence[index], self.rows[index], self._source)
+
+    def filter(self, predicate: PredicateType | None = None, min_confidence: float | None = None) -> "RelationshipBatch":
+        """
+        Select relationships by predicate and/or minimum confidence.
+
+        Args:
+
+            predicate: Keep only relationships of this type
+            min_confidence: Keep only relationships with confidence >= this value
+
+        Returns:
+
+            A new batch containing the matching rows
+        """
+        import numpy as np
+
+        mask = np.ones(len(self), dtype=bool)
+        if predicate is not None:
+            mask &= self.predicate_codes == PREDICATE_CODES[PredicateType(predicate)]
+        if min_confidence is not None:
+            mask &= self.confidence >= min_confidence
+        return self[mask]
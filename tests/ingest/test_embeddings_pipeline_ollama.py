@@ -22,7 +22,11 @@ from med_lit_schema.ingest.embeddings_pipeline import (
     create_entity_embeddings_table,
     get_entities,
     insert_entity_embedding,
+    insert_entity_embeddings,
     load_embedding,
+    load_embeddings,
+    top_k_cosine,
+    tune_sqlite_connection,
 )
 
 
@@ -191,6 +195,27 @@ class TestInsertEntityEmbedding:
 
             conn.close()
 
+    def test_insert_entity_embeddings_batch(self):
+        """Test that a batch of embeddings is written in one transaction."""
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            conn = sqlite3.connect(db_path)
+
+            create_entity_embeddings_table(conn)
+
+            rows = [(f"C{i:04d}", np.full(3, i, dtype=np.float32)) for i in range(5)]
+            insert_entity_embeddings(conn, rows, "nomic-embed-text")
+
+            assert not conn.in_transaction
+            cursor = conn.cursor()
+            cursor.execute("SELECT entity_id, embedding FROM entity_embeddings ORDER BY entity_id")
+            results = cursor.fetchall()
+
+            assert [r[0] for r in results] == [r[0] for r in rows]
+            assert np.frombuffer(results[4][1], dtype=np.float32).tolist() == [4.0, 4.0, 4.0]
+
+            conn.close()
+
 
 class TestLoadEmbedding:
     """Test load_embedding function."""
@@ -221,6 +246,41 @@ class TestLoadEmbedding:
             assert loaded.shape == (768,)
 
 
+class TestTopKCosine:
+    """Test load_embeddings and top_k_cosine functions."""
+
+    def test_load_embeddings_builds_matrix(self):
+        """Test that stored blobs load into a (rows, dim) matrix."""
+        rows = np.arange(10, dtype=np.float32).reshape(2, 5)
+        with patch("med_lit_schema.ingest.embeddings_pipeline.EMBEDDING_DIM", 5):
+            matrix = load_embeddings([row.tobytes() for row in rows])
+        assert matrix.shape == (2, 5)
+        assert np.array_equal(matrix, rows)
+
+    def test_top_k_cosine_orders_by_similarity(self):
+        """Test ranking, truncation to top_k and zero-vector handling."""
+        target = np.array([1.0, 0.0], dtype=np.float32)
+        matrix = np.array([[0.0, 1.0], [2.0, 0.0], [1.0, 1.0], [0.0, 0.0]], dtype=np.float32)
+
+        ranked = top_k_cosine(target, matrix, 3)
+
+        assert [i for i, _ in ranked] == [1, 2, 0]
+        assert ranked[0][1] == pytest.approx(1.0)
+        assert ranked[1][1] == pytest.approx(np.sqrt(0.5))
+        assert top_k_cosine(target, matrix, 0) == []
+        assert [i for i, _ in top_k_cosine(target, matrix, 10)] == [1, 2, 0, 3]
+
+    def test_top_k_cosine_keeps_ties_in_row_order(self):
+        """Test that ties at the top_k cutoff resolve to the earliest rows."""
+        matrix = np.zeros((300, 2), dtype=np.float32)
+        matrix[:, 1] = 1.0
+        matrix[50:250] = [1.0, 0.0]
+
+        ranked = top_k_cosine(np.array([1.0, 0.0], dtype=np.float32), matrix, 3)
+
+        assert [i for i, _ in ranked] == [50, 51, 52]
+
+
 class TestGenerateEntityEmbeddings:
     """Test generate_entity_embeddings function."""
 
@@ -469,3 +529,25 @@ class TestEmbeddingsIntegrationWithOllama:
             assert len(embedding_bytes) > 0
 
             conn.close()
+
+
+class TestTuneSqliteConnection:
+    """Test tune_sqlite_connection PRAGMAs."""
+
+    def test_tuning_is_per_connection(self):
+        """Test that tuning sets synchronous=NORMAL without converting the file to WAL."""
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            conn = sqlite3.connect(db_path)
+
+            tune_sqlite_connection(conn)
+            create_entity_embeddings_table(conn)
+
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+            conn.close()
+
+            assert not (Path(tmpdir) / "test.db-wal").exists()
+            fresh = sqlite3.connect(db_path)
+            assert fresh.execute("PRAGMA synchronous").fetchone()[0] == 2  # back to FULL
+            fresh.close()
@@ -0,0 +1,73 @@
+"""
+Tests for the SentenceTransformer embedding generator.
+
+The model itself is mocked, so these tests only need the sentence-transformers
+package to be importable.
+
+Run with: pytest tests/ingest/test_sentence_transformer_embedding_generator.py -v
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("sentence_transformers")
+
+from med_lit_schema.ingest.embedding_generators import SentenceTransformerEmbeddingGenerator  # noqa: E402
+
+
+def _fake_encode(texts, **kwargs):
+    return np.array([[float(len(text)), 1.0, 0.5] for text in texts], dtype=np.float32)
+
+
+class TestSentenceTransformerEmbeddingCache:
+    """Test the single-text embedding cache."""
+
+    @patch("med_lit_schema.ingest.embedding_generators.SentenceTransformer")
+    def test_repeated_text_calls_model_once(self, mock_model_class):
+        """Test that a cached text is only encoded once."""
+        mock_model = mock_model_class.return_value
+        mock_model.encode.side_effect = _fake_encode
+
+        generator = SentenceTransformerEmbeddingGenerator(cache_size=8)
+        mock_model.encode.reset_mock()
+
+        first = generator.generate_embedding("aspirin")
+        second = generator.generate_embedding("aspirin")
+
+        assert mock_model.encode.call_count == 1
+        assert first == second == [7.0, 1.0, 0.5]
+        # Callers get their own list, not a view of the cached vector
+        first.append(0.0)
+        assert generator.generate_embedding("aspirin") == [7.0, 1.0, 0.5]
+
+    @patch("med_lit_schema.ingest.embedding_generators.SentenceTransformer")
+    def test_cache_disabled_by_default(self, mock_model_class):
+        """Test that without cache_size every call reaches the model."""
+        mock_model = mock_model_class.return_value
+        mock_model.encode.side_effect = _fake_encode
+
+        generator = SentenceTransformerEmbeddingGenerator()
+        mock_model.encode.reset_mock()
+
+        generator.generate_embedding("aspirin")
+        generator.generate_embedding("aspirin")
+
+        assert mock_model.encode.call_count == 2
+
+    @patch("med_lit_schema.ingest.embedding_generators.SentenceTransformer")
+    def test_size_one_cache_is_thread_safe(self, mock_model_class):
+        """Test that concurrent lookups and evictions on a tiny cache never raise."""
+        mock_model = mock_model_class.return_value
+        mock_model.encode.side_effect = _fake_encode
+
+        generator = SentenceTransformerEmbeddingGenerator(cache_size=1)
+        texts = ["a", "bb", "ccc", "dddd"] * 500
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(generator.generate_embedding, texts))
+
+        assert [r[0] for r in results] == [float(len(t)) for t in texts]
+        assert len(generator._cache) == 1
@@ -27,6 +27,8 @@ import pytest
 from pydantic import ValidationError
 
 from med_lit_schema.base import (
+    PREDICATE_CODES,
+    PREDICATES_BY_CODE,
     ClaimPredicate,
     PredicateType,
     Provenance,
@@ -144,3 +146,14 @@ def test_model_info_validation():
         ModelInfo(provider="anthropic")  # Missing name
     with pytest.raises(ValidationError):
         ModelInfo(name="claude-3-opus")  # Missing provider
+
+
+def test_predicate_codes_cover_every_predicate():
+    """
+    Every `PredicateType` needs a unique integer code that fits in an int8 column,
+    and the reverse table must round-trip.
+    """
+    assert set(PREDICATE_CODES) == set(PredicateType)
+    assert len(set(PREDICATE_CODES.values())) == len(PREDICATE_CODES)
+    assert all(0 < code < 128 for code in PREDICATE_CODES.values())
+    assert all(PREDICATES_BY_CODE[code] is predicate for predicate, code in PREDICATE_CODES.items())
@@ -336,3 +336,21 @@ def test_mixed_entity_types_retrieval():
     assert isinstance(collection.get_by_id("D1"), Disease)
     assert isinstance(collection.get_by_id("G1"), Gene)
     assert isinstance(collection.get_by_id("R1"), Drug)
+
+
+def test_trusted_load_matches_validated_load(tmp_path):
+    """Test that a trusted load of a saved collection matches a validated load."""
+    collection = InMemoryEntityCollection()
+    collection.add_disease(Disease(entity_id="D1", name="Disease", entity_type="disease", umls_id="U1", embedding=[0.1, 0.2]))
+    collection.add_gene(Gene(entity_id="G1", name="Gene", entity_type="gene", hgnc_id="H1"))
+
+    path = tmp_path / "entities.jsonl"
+    collection.save(str(path))
+
+    validated = InMemoryEntityCollection.load(str(path))
+    trusted = InMemoryEntityCollection.load(str(path), trusted=True)
+
+    assert trusted.entity_count == validated.entity_count == 2
+    assert isinstance(trusted.get_by_id("D1"), Disease)
+    assert trusted.get_by_umls("U1").embedding == [0.1, 0.2]
+    assert trusted.get_by_id("G1").created_at == validated.get_by_id("G1").created_at
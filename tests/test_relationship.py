@@ -1,6 +1,11 @@
+import pytest
+from pydantic import ValidationError
+
 from med_lit_schema.relationship import (
     create_relationship,
+    create_relationship_trusted,
     PredicateType,
+    RelationshipBatch,
     Treats,
     Causes,
     Cites,
@@ -28,3 +33,61 @@ def test_create_causes_and_cites():
     cites = create_relationship(PredicateType.CITES, subject_id="P1", object_id="P2", context="discussion")
     assert isinstance(cites, Cites)
     assert cites.predicate == PredicateType.CITES
+
+
+def test_create_relationship_trusted_matches_validated():
+    kwargs = dict(response_rate=0.5, source_papers=["PMC1"], confidence=0.9)
+    trusted = create_relationship_trusted("treats", subject_id="RxNorm:1", object_id="C0", **kwargs)
+    validated = create_relationship(PredicateType.TREATS, subject_id="RxNorm:1", object_id="C0", **kwargs)
+    assert isinstance(trusted, Treats)
+    assert trusted.predicate is PredicateType.TREATS
+    assert trusted.model_dump() == validated.model_dump()
+
+
+@pytest.mark.parametrize("field", ["confidence", "response_rate"])
+def test_probability_fields_reject_out_of_range(field):
+    with pytest.raises(ValidationError):
+        create_relationship(PredicateType.TREATS, subject_id="RxNorm:1", object_id="C0", **{field: 1.5})
+
+
+def test_ids_are_interned():
+    a = create_relationship(PredicateType.TREATS, subject_id="".join(["RxNorm:", "1"]), object_id="C0", source_papers=["".join(["PMC", "1"])])
+    b = create_relationship(PredicateType.TREATS, subject_id="".join(["RxNorm:", "1"]), object_id="C0", source_papers=["".join(["PMC", "1"])])
+    assert a.subject_id is b.subject_id
+    assert a.source_papers[0] is b.source_papers[0]
+
+
+def test_relationship_batch_filter_and_round_trip():
+    rels = [
+        create_relationship(PredicateType.CAUSES, subject_id="C1", object_id="S1", confidence=0.9),
+        create_relationship(PredicateType.CAUSES, subject_id="C1", object_id="S2", confidence=0.3),
+        create_relationship(PredicateType.TREATS, subject_id="RxNorm:1", object_id="C1", confidence=0.95),
+        create_relationship(PredicateType.CITES, subject_id="P1", object_id="P2"),
+    ]
+    batch = RelationshipBatch.from_relationships(rels)
+    assert len(batch) == 4
+
+    strong_causes = batch.filter(predicate=PredicateType.CAUSES, min_confidence=0.5)
+    assert list(strong_causes.object_ids) == ["S1"]
+    assert len(batch.filter(predicate=PredicateType.CITES)) == 1
+
+    assert strong_causes.to_relationships() == [rels[0]]
+    assert batch.to_relationships() == rels
+
+    skeletons = batch.to_skeleton_relationships()
+    assert [type(r) for r in skeletons] == [type(r) for r in rels]
+    assert skeletons[2].confidence == 0.95
+    assert skeletons[3].predicate is PredicateType.CITES
+
+
+def test_relationship_batch_scalar_index_keeps_full_models():
+    rel = create_relationship(PredicateType.TREATS, subject_id="RxNorm:1", object_id="C1", confidence=0.7, source_papers=["PMC1"], response_rate=0.4)
+    batch = RelationshipBatch.from_relationships([rel])
+
+    row = batch[0]
+    assert len(row) == 1
+    assert row.to_relationships() == [rel]
+    assert row.to_relationships()[0].source_papers == ["PMC1"]
+    assert row.to_skeleton_relationships()[0].confidence == 0.7
+    with pytest.raises(ValueError):
+        RelationshipBatch(row.subject_ids, row.predicate_codes, row.object_ids, row.confidence).to_relationships()
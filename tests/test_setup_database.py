@@ -18,7 +18,7 @@ import pytest
 from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.exc import OperationalError
 
-from med_lit_schema.setup_database import setup_database
+from med_lit_schema.setup_database import configure_hnsw_params, resolve_hnsw_params, setup_database
 
 
 # Check if PostgreSQL is available
@@ -210,6 +210,18 @@ def test_setup_database_creates_triggers(temp_database):
         ).fetchone()
         assert result[0] > 0, "update_relationships_updated_at trigger should exist"
 
+        # Check that no-op updates to relationships are suppressed
+        result = conn.execute(
+            text(
+                """
+            SELECT COUNT(*) FROM pg_trigger
+            WHERE tgname = 'suppress_redundant_relationships_update'
+            AND tgrelid = 'relationships'::regclass
+        """
+            )
+        ).fetchone()
+        assert result[0] > 0, "suppress_redundant_relationships_update trigger should exist"
+
     engine.dispose()
 
 
@@ -244,3 +256,106 @@ def test_setup_database_can_insert_after_setup(temp_database):
         assert result[1] == "Test Disease"
 
     engine.dispose()
+
+
+def test_setup_database_creates_tuned_hnsw_index(temp_database):
+    """Test that the HNSW index is built with the requested m/ef_construction."""
+    setup_database(temp_database, hnsw_m=20, hnsw_ef_construction=100)
+
+    engine = create_engine(temp_database)
+    with engine.connect() as conn:
+        indexdef = conn.execute(text("SELECT indexdef FROM pg_indexes WHERE indexname = 'idx_entities_embedding'")).scalar()
+
+        assert indexdef is not None, "idx_entities_embedding should exist"
+        assert "hnsw" in indexdef
+        assert "m='20'" in indexdef
+        assert "ef_construction='100'" in indexdef
+
+    engine.dispose()
+
+
+def test_setup_database_rebuilds_hnsw_index_with_new_params(temp_database):
+    """Test that re-running with different m/ef_construction rebuilds the existing index."""
+    setup_database(temp_database)
+    setup_database(temp_database, hnsw_m=20, hnsw_ef_construction=100)
+
+    engine = create_engine(temp_database)
+    with engine.connect() as conn:
+        indexdef = conn.execute(text("SELECT indexdef FROM pg_indexes WHERE indexname = 'idx_entities_embedding'")).scalar()
+
+        assert "m='20'" in indexdef
+        assert "ef_construction='100'" in indexdef
+
+    engine.dispose()
+
+
+def test_configure_hnsw_params_tiers():
+    """Test that HNSW parameters scale up with table size."""
+    assert configure_hnsw_params(0) == {"m": 16, "ef_construction": 64}
+    assert configure_hnsw_params(500_000) == {"m": 24, "ef_construction": 100}
+    assert configure_hnsw_params(5_000_000) == {"m": 32, "ef_construction": 128}
+
+
+def test_resolve_hnsw_params_keeps_ef_construction_at_least_2m():
+    """Test that a lone explicit m or ef_construction is paired with a valid tier value."""
+    assert resolve_hnsw_params(0, m=48) == {"m": 48, "ef_construction": 96}
+    assert resolve_hnsw_params(0, ef_construction=20) == {"m": 10, "ef_construction": 20}
+    assert resolve_hnsw_params(0, m=20, ef_construction=100) == {"m": 20, "ef_construction": 100}
+
+
+@pytest.mark.parametrize("m, ef_construction", [(1, None), (101, None), (None, 2000), (48, 64)])
+def test_setup_database_rejects_invalid_hnsw_params(m, ef_construction):
+    """Test that out-of-range HNSW parameters fail before touching the database."""
+    with pytest.raises(ValueError):
+        setup_database("postgresql://unused/unused", hnsw_m=m, hnsw_ef_construction=ef_construction)
+
+
+def test_setup_database_halfvec_precision(temp_database):
+    """Test that precision="halfvec" stores embeddings as halfvec with a matching HNSW index."""
+    setup_database(temp_database, precision="halfvec")
+
+    engine = create_engine(temp_database)
+    with engine.connect() as conn:
+        udt_name = conn.execute(text("SELECT udt_name FROM information_schema.columns WHERE table_name = 'entities' AND column_name = 'embedding'")).scalar()
+        indexdef = conn.execute(text("SELECT indexdef FROM pg_indexes WHERE indexname = 'idx_entities_embedding'")).scalar()
+
+        assert udt_name == "halfvec"
+        assert "halfvec_cosine_ops" in indexdef
+
+    engine.dispose()
+
+
+def test_setup_database_rerun_keeps_embeddings(temp_database):
+    """Test that re-running setup_database does not drop existing embeddings."""
+    setup_database(temp_database, skip_vector_index=True)
+
+    engine = create_engine(temp_database)
+    embedding = "[" + ",".join(["0.5"] * 768) + "]"
+    with engine.connect() as conn:
+        conn.execute(
+            text("INSERT INTO entities (id, entity_type, name, mentions, source, embedding) VALUES ('TEST:001', 'disease', 'Test Disease', 0, 'test', :embedding)"),
+            {"embedding": embedding},
+        )
+        conn.commit()
+
+    setup_database(temp_database, skip_vector_index=True)
+
+    with engine.connect() as conn:
+        result = conn.execute(text("SELECT embedding IS NOT NULL FROM entities WHERE id = 'TEST:001'")).scalar()
+        assert result, "embedding should survive a second setup run"
+
+    engine.dispose()
+
+
+def test_setup_database_creates_relationship_indexes(temp_database):
+    """Test that setup_database indexes relationships for triple and reverse lookups."""
+    setup_database(temp_database, skip_vector_index=True)
+
+    engine = create_engine(temp_database)
+    with engine.connect() as conn:
+        indexes = {row[0] for row in conn.execute(text("SELECT indexname FROM pg_indexes WHERE tablename = 'relationships'"))}
+
+        assert {"idx_relationships_spo", "idx_relationships_object", "idx_relationships_predicate"} <= indexes
+        assert "idx_relationships_subject" not in indexes, "spo index already covers subject-only lookups"
+
+    engine.dispose()